@@ -1,3 +1,8 @@
+import sys as _sys
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+
 try:
     from ._version import version as __version__
 except ImportError:
@@ -26,21 +31,89 @@ __all__ = [
     "standard_metadata",
 ]
 
-from .callers import HookResult
-from .dist import get_metadata, standard_metadata
-from .exceptions import (
-    HookCallError,
-    PluginCallError,
-    PluginError,
-    PluginImplementationError,
-    PluginImportError,
-    PluginRegistrationError,
-    PluginValidationError,
+if _TYPE_CHECKING:
+    from .callers import HookResult
+    from .dist import get_metadata, standard_metadata
+    from .exceptions import (
+        HookCallError,
+        PluginCallError,
+        PluginError,
+        PluginImplementationError,
+        PluginImportError,
+        PluginRegistrationError,
+        PluginValidationError,
+    )
+    from .hooks import HookCaller
+    from .implementation import HookImplementation, HookSpecification
+    from .manager import PluginManager
+    from .markers import HookImplementationMarker, HookSpecificationMarker
+
+    napari_hook_implementation = HookImplementationMarker("napari")
+    napari_hook_specification = HookSpecificationMarker("napari")
+
+# Public names are imported from their submodule on first access (PEP 562),
+# so that e.g. a plugin importing only ``napari_hook_implementation`` does not
+# pay for importing the plugin manager and package metadata machinery.
+_LAZY = {
+    "HookResult": ".callers",
+    "get_metadata": ".dist",
+    "standard_metadata": ".dist",
+    "HookCallError": ".exceptions",
+    "PluginCallError": ".exceptions",
+    "PluginError": ".exceptions",
+    "PluginImplementationError": ".exceptions",
+    "PluginImportError": ".exceptions",
+    "PluginRegistrationError": ".exceptions",
+    "PluginValidationError": ".exceptions",
+    "HookCaller": ".hooks",
+    "HookImplementation": ".implementation",
+    "HookSpecification": ".implementation",
+    "PluginManager": ".manager",
+    "HookImplementationMarker": ".markers",
+    "HookSpecificationMarker": ".markers",
+}
+# submodules, which used to be imported along with the public names
+_SUBMODULES = frozenset(
+    {
+        "_tracing",
+        "callers",
+        "dist",
+        "exceptions",
+        "hooks",
+        "implementation",
+        "manager",
+        "markers",
+    }
 )
-from .hooks import HookCaller
-from .implementation import HookImplementation, HookSpecification
-from .manager import PluginManager
-from .markers import HookImplementationMarker, HookSpecificationMarker
+# marker instances: name -> (marker class, project_name)
+_LAZY_MARKERS = {
+    "napari_hook_implementation": ("HookImplementationMarker", "napari"),
+    "napari_hook_specification": ("HookSpecificationMarker", "napari"),
+}
+
+
+def __getattr__(name: str) -> _Any:
+    if name in _LAZY:
+        value = getattr(_import_module(_LAZY[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = _import_module(f".{name}", __name__)
+    elif name in _LAZY_MARKERS:
+        marker_cls, project_name = _LAZY_MARKERS[name]
+        value = __getattr__(marker_cls)(project_name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # list lazy names without importing them
+    return sorted(set(globals()).union(__all__, _SUBMODULES))
+
 
-napari_hook_implementation = HookImplementationMarker("napari")
-napari_hook_specification = HookSpecificationMarker("napari")
+if _sys.version_info < (3, 7):
+    # module-level __getattr__ is not supported before python 3.7
+    for _name in __all__:
+        __getattr__(_name)
+    for _name in _SUBMODULES:
+        __getattr__(_name)
@@ -15,6 +15,26 @@ def _raise_wrapfail(wrap_controller, msg):
     )
 
 
+def _missing_args_error(
+    hook_impl: HookImplementation, caller_kwargs: dict
+) -> HookCallError:
+    return HookCallError(
+        "hook call must provide argument the following "
+        f"arguments: {set(hook_impl.argnames)!r}, but provided"
+        f" {set(caller_kwargs)!r}"
+    )
+
+
+def _run_teardowns(teardowns: list, outcome: 'HookResult'):
+    """Run all hook wrapper post-yield blocks (in reverse order)."""
+    for gen in reversed(teardowns):
+        try:
+            gen.send(outcome)
+            _raise_wrapfail(gen, "has second yield")
+        except StopIteration:
+            pass
+
+
 ExcInfo = Union[
     Tuple[Type[BaseException], BaseException, TracebackType],
     Tuple[None, None, None],
@@ -44,6 +64,15 @@ class HookResult:
         during the multicall loop.
     """
 
+    __slots__ = (
+        '_result',
+        'implementation',
+        'is_firstresult',
+        '_excinfo',
+        'plugin_errors',
+        '_modified_by',
+    )
+
     def __init__(
         self,
         result: List[Tuple[Any, HookImplementation]],
@@ -51,27 +80,67 @@ class HookResult:
         firstresult: bool = False,
         plugin_errors: Optional[List[PluginCallError]] = None,
     ):
-        self._result: Any = []
-        #: The HookImplementation(s) that were responsible for each result in ``result``
-        self.implementation: Optional[
+        results: List[Any] = []
+        implementations: List[HookImplementation] = []
+        for res, impl in result or ():
+            results.append(res)
+            implementations.append(impl)
+        if firstresult:
+            self._setup(
+                results[0] if results else None,
+                implementations[0] if implementations else None,
+                excinfo,
+                True,
+                plugin_errors,
+            )
+        else:
+            self._setup(
+                results, implementations, excinfo, False, plugin_errors
+            )
+
+    @classmethod
+    def _from_multi(
+        cls,
+        results: List[Any],
+        implementations: List[HookImplementation],
+        excinfo: Optional[ExcInfo],
+        plugin_errors: Optional[List[PluginCallError]] = None,
+    ) -> 'HookResult':
+        """Create a HookResult from parallel lists of results and impls."""
+        self = cls.__new__(cls)
+        self._setup(results, implementations, excinfo, False, plugin_errors)
+        return self
+
+    @classmethod
+    def _from_first(
+        cls,
+        result: Any,
+        implementation: Optional[HookImplementation],
+        excinfo: Optional[ExcInfo],
+        plugin_errors: Optional[List[PluginCallError]] = None,
+    ) -> 'HookResult':
+        """Create a ``firstresult`` HookResult from a single result/impl."""
+        self = cls.__new__(cls)
+        self._setup(result, implementation, excinfo, True, plugin_errors)
+        return self
+
+    def _setup(
+        self,
+        result: Any,
+        implementation: Optional[
             Union[HookImplementation, List[HookImplementation]]
-        ] = []
+        ],
+        excinfo: Optional[ExcInfo],
+        firstresult: bool,
+        plugin_errors: Optional[List[PluginCallError]],
+    ):
+        self._result: Any = result
+        #: The HookImplementation(s) that were responsible for each result in ``result``
+        self.implementation = implementation
         #: Whether this HookResult came from a ``firstresult`` multicall.
         self.is_firstresult: bool = firstresult
         self._excinfo = excinfo
         self.plugin_errors = plugin_errors
-
-        if result:
-            self._result, self.implementation = tuple(zip(*result))
-            self._result = list(self._result)
-        if firstresult:
-            if self._result:
-                self._result = self._result[0]
-                self.implementation = self.implementation[0]  # type: ignore
-            else:
-                self._result = None
-                self.implementation = None
-
         #: Name of last hookwrapper that changed the result, if any
         self._modified_by: Optional[str] = None
 
@@ -100,11 +169,9 @@ class HookResult:
         be set otherwise set a (modified) list of results. Any exceptions
         found during invocation will be deleted.
         """
-        import inspect
-
         self._result = result
         self._excinfo = None
-        self._modified_by = inspect.stack()[1].function
+        self._modified_by = sys._getframe(1).f_code.co_name
 
     @property
     def result(self) -> Union[Any, List[Any]]:
@@ -155,43 +222,37 @@ def _multicall(
         If ``firstresult == True`` and a plugin raises an Exception.
     """
     __tracebackhide__ = True
-    results = []
+    if not hook_impls:
+        # nothing to call (and so no wrappers to run)
+        if firstresult:
+            return HookResult._from_first(None, None, None, [])
+        return HookResult._from_multi([], [], None, [])
+
+    results: List[Any] = []
+    implementations: List[HookImplementation] = []
     errors: List['PluginCallError'] = []
     excinfo: Optional[ExcInfo] = None
+    add_result = results.append
+    add_implementation = implementations.append
     try:  # run impl and wrapper setup functions in a loop
         teardowns = []
         try:
             for hook_impl in reversed(hook_impls):
                 # skip disabled hook implementations
-                if not getattr(hook_impl, 'enabled', True):
+                if not hook_impl.enabled:
                     continue
-                args: List[Any] = []
                 try:
-                    args = [
-                        caller_kwargs[argname]
-                        for argname in hook_impl.argnames
-                    ]
+                    args = hook_impl._get_args(caller_kwargs)
                 except KeyError:
-                    raise HookCallError(
-                        "hook call must provide argument the following "
-                        f"arguments: {set(hook_impl.argnames)!r}, but provided"
-                        f" {set(caller_kwargs)!r}"
-                    )
+                    raise _missing_args_error(hook_impl, caller_kwargs)
 
-                if hook_impl.hookwrapper:
-                    try:
-                        gen = hook_impl(*args)
-                        next(gen)  # first yield
-                        teardowns.append(gen)
-                    except StopIteration:
-                        _raise_wrapfail(gen, "did not yield")
-                else:
-                    res = None
+                function = hook_impl.function
+                if not hook_impl.hookwrapper:
                     # this is where the plugin function actually gets called
                     # we put it in a try/except so that if one plugin throws
                     # an exception, we don't lose the whole loop
                     try:
-                        res = hook_impl(*args)
+                        res = function(*args)
                     except Exception as exc:
                         # creating a PluginCallError will store it for later
                         # in plugins.exceptions.PLUGIN_ERRORS
@@ -199,30 +260,39 @@ def _multicall(
                         # if it was a `firstresult` hook, break and raise now.
                         if firstresult:
                             break
+                        continue
 
                     if res is not None:
-                        results.append((res, hook_impl))
+                        add_result(res)
+                        add_implementation(hook_impl)
                         if firstresult:  # halt further impl calls
                             break
+                    continue
+
+                # hook wrappers are the less common case, set them up last
+                try:
+                    gen = function(*args)
+                    next(gen)  # first yield
+                    teardowns.append(gen)
+                except StopIteration:
+                    _raise_wrapfail(gen, "did not yield")
         except BaseException:
             excinfo = sys.exc_info()
     finally:
         if firstresult and errors:
             raise errors[-1]
 
-        outcome = HookResult(
-            results,
-            excinfo=excinfo,
-            firstresult=firstresult,
-            plugin_errors=errors,
-        )
-
-        # run all wrapper post-yield blocks
-        for gen in reversed(teardowns):
-            try:
-                gen.send(outcome)
-                _raise_wrapfail(gen, "has second yield")
-            except StopIteration:
-                pass
+        if not firstresult:
+            outcome = HookResult._from_multi(
+                results, implementations, excinfo, errors
+            )
+        elif results:
+            outcome = HookResult._from_first(
+                results[0], implementations[0], excinfo, errors
+            )
+        else:
+            outcome = HookResult._from_first(None, None, excinfo, errors)
 
+        if teardowns:
+            _run_teardowns(teardowns, outcome)
         return outcome
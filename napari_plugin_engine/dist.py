@@ -1,25 +1,120 @@
 import inspect
 import sys
-from functools import lru_cache
-from typing import Any, Dict, Optional, overload
-
-if sys.version_info >= (3, 8):
-    from importlib import metadata as importlib_metadata
-else:
-    import importlib_metadata
-
-
-@lru_cache(maxsize=1)
-def _top_level_module_to_dist() -> Dict[str, importlib_metadata.Distribution]:
-    mapping = {}
-    for dist in importlib_metadata.distributions():
-        modules = dist.read_text('top_level.txt')
-        if modules:
-            for mod in modules.split('\n'):
-                if not mod:
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    overload,
+)
+
+if TYPE_CHECKING:
+    if sys.version_info >= (3, 8):
+        from importlib import metadata as importlib_metadata
+    else:
+        import importlib_metadata
+
+
+def _importlib_metadata():
+    """Return the ``importlib.metadata`` module, imported on first use.
+
+    It is deferred because it is comparatively slow to import and is only
+    needed once plugin metadata is actually requested.  Once imported, it is
+    available as the ``importlib_metadata`` attribute of this module (which
+    may be replaced, e.g. in tests).
+    """
+    namespace = globals()
+    if 'importlib_metadata' not in namespace:
+        if sys.version_info >= (3, 8):
+            from importlib import metadata
+        else:
+            import importlib_metadata as metadata
+        namespace['importlib_metadata'] = metadata
+    return namespace['importlib_metadata']
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'importlib_metadata':
+        return _importlib_metadata()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ is not supported before python 3.7
+    _importlib_metadata()
+
+
+# sys.path -> distributions found on that path (only the most recent path is
+# kept, plugin discovery adds a different path to sys.path on every call)
+_DISTRIBUTIONS: Dict[
+    Tuple[str, ...], Tuple['importlib_metadata.Distribution', ...]
+] = {}
+
+
+def _distributions() -> Tuple['importlib_metadata.Distribution', ...]:
+    """Return (cached) distributions found on the current ``sys.path``.
+
+    Shared by plugin discovery and :func:`get_dist`, so that the environment
+    is only searched for distributions once.  A directory listed more than
+    once on ``sys.path`` yields the same distributions more than once, so
+    these are deduplicated by their metadata location.
+    """
+    key = tuple(sys.path)
+    dists = _DISTRIBUTIONS.get(key)
+    if dists is None:
+        seen = set()
+        unique = []
+        for dist in _importlib_metadata().distributions():
+            # PathDistribution (the usual kind) keeps its location in _path
+            location = getattr(dist, '_path', None)
+            if location is not None:
+                location = str(location)
+                if location in seen:
                     continue
-                mapping[mod] = dist
-    return mapping
+                seen.add(location)
+            unique.append(dist)
+        _DISTRIBUTIONS.clear()
+        dists = _DISTRIBUTIONS[key] = tuple(unique)
+    return dists
+
+
+class _TopLevelModuleToDist:
+    """Lazy mapping of top level module name -> distribution providing it.
+
+    Distributions are only scanned (reading their ``top_level.txt``) until the
+    requested module is found, so that looking up one plugin does not require
+    reading the metadata of every installed distribution.
+    """
+
+    def __init__(self):
+        self.cache_clear()
+
+    def cache_clear(self):
+        _DISTRIBUTIONS.clear()
+        self._mapping: Dict[str, 'importlib_metadata.Distribution'] = {}
+        # distributions that have not been looked at yet
+        self._unscanned: Optional[Iterator] = None
+
+    def get(self, module: str) -> Optional['importlib_metadata.Distribution']:
+        mapping = self._mapping
+        if module in mapping:
+            return mapping[module]
+        if self._unscanned is None:
+            self._unscanned = iter(_distributions())
+        for dist in self._unscanned:
+            modules = dist.read_text('top_level.txt')
+            if modules:
+                for mod in filter(None, modules.splitlines()):
+                    # the first distribution on sys.path wins, as for imports
+                    mapping.setdefault(mod, dist)
+                if module in mapping:
+                    return mapping[module]
+        return None
+
+
+_top_level_module_to_dist = _TopLevelModuleToDist()
 
 
 def _object_to_top_level_module(obj: Any) -> Optional[str]:
@@ -28,7 +123,7 @@ def _object_to_top_level_module(obj: Any) -> Optional[str]:
     return name.split('.')[0] if name else None
 
 
-def get_dist(obj) -> Optional[importlib_metadata.Distribution]:
+def get_dist(obj) -> Optional['importlib_metadata.Distribution']:
     """Return a :class:`importlib.metadata.Distribution` for any python object.
 
     Parameters
@@ -42,17 +137,22 @@ def get_dist(obj) -> Optional[importlib_metadata.Distribution]:
         The distribution object for the corresponding package, if found.
     """
     if isinstance(obj, str):
+        metadata = _importlib_metadata()
         try:
-            return importlib_metadata.distribution(obj)
-        except importlib_metadata.PackageNotFoundError:
+            return metadata.distribution(obj)
+        except metadata.PackageNotFoundError:
             return None
     top_level = _object_to_top_level_module(obj)
-    return _top_level_module_to_dist().get(top_level or '')
+    return _top_level_module_to_dist.get(top_level) if top_level else None
 
 
 def get_version(plugin) -> str:
     dist = get_dist(plugin)
-    version = dist.metadata.get('version') if dist else ''
+    return _get_version(plugin, dist.metadata if dist else None)
+
+
+def _get_version(plugin, dist_metadata) -> str:
+    version = dist_metadata.get('version') if dist_metadata else ''
     if not version and inspect.ismodule(plugin):
         version = getattr(plugin, '__version__', '')
     if not version:
@@ -96,11 +196,14 @@ def get_metadata(plugin, *args):  # noqa: F811
     dist = get_dist(plugin)
     dct = {}
     if dist:
+        # Distribution.metadata reads and parses the METADATA file on every
+        # access, so only do it once.
+        dist_metadata = dist.metadata
         for a in args:
             if a == 'version':
-                dct[a] = get_version(plugin)
+                dct[a] = _get_version(plugin, dist_metadata)
             else:
-                dct[a] = dist.metadata.get(a)
+                dct[a] = dist_metadata.get(a)
     if len(args) == 1:
         return dct[args[0]] if dct else None
     return dct
@@ -148,13 +251,15 @@ def standard_metadata(plugin: Any) -> Dict[str, Optional[str]]:
         'author',
         'license',
         'Author-Email',
+        'Maintainer-Email',
         'Home-page',
+        'Download-Url',
     )
     meta['package'] = meta.pop('name')
-    meta['email'] = meta.pop('Author-Email') or get_metadata(
-        plugin, 'Maintainer-Email'
-    )
-    meta['url'] = meta.pop('Home-page') or get_metadata(plugin, 'Download-Url')
+    maintainer_email = meta.pop('Maintainer-Email')
+    meta['email'] = meta.pop('Author-Email') or maintainer_email
+    download_url = meta.pop('Download-Url')
+    meta['url'] = meta.pop('Home-page') or download_url
     if meta['url'] == 'UNKNOWN':
         meta['url'] = None
     return meta
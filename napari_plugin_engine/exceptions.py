@@ -34,6 +34,12 @@ class PluginError(Exception):
         by default None
     """
 
+    #: Whether new errors are stored for later retrieval with :meth:`get`.
+    record_enabled: bool = True
+    #: Maximum number of errors kept for :meth:`get`, oldest are dropped first.
+    #: (``None`` for no limit.)
+    max_records: Optional[int] = 1000
+
     _record: List['PluginError'] = []
 
     def __init__(
@@ -53,8 +59,13 @@ class PluginError(Exception):
                 message += f': {cause}'
         super().__init__(message)
         self.__cause__ = cause
-        # store all PluginError instances.  can be retrieved with get()
-        PluginError._record.append(self)
+        # store PluginError instances.  can be retrieved with get()
+        if PluginError.record_enabled:
+            record = PluginError._record
+            record.append(self)
+            max_records = PluginError.max_records
+            if max_records is not None and len(record) > max_records:
+                del record[: len(record) - max_records]
 
     @classmethod
     def get(
@@ -88,24 +99,23 @@ class PluginError(Exception):
         TypeError
             If ``error_type`` is provided and is not an exception class.
         """
+        if error_type is not _empty and not (
+            isinstance(error_type, type)
+            and issubclass(error_type, BaseException)
+        ):
+            raise TypeError(
+                "The `error_type` argument must be an exception class"
+            )
         errors: List['PluginError'] = []
         for error in cls._record:
             if plugin is not _empty and error.plugin != plugin:
                 continue
             if plugin_name is not _empty and error.plugin_name != plugin_name:
                 continue
-            if error_type is not _empty:
-                import inspect
-
-                if not (
-                    inspect.isclass(error_type)
-                    and issubclass(error_type, BaseException)
-                ):
-                    raise TypeError(
-                        "The `error_type` argument must be an exception class"
-                    )
-                if not isinstance(error.__cause__, error_type):
-                    continue
+            if error_type is not _empty and not isinstance(
+                error.__cause__, error_type
+            ):
+                continue
             errors.append(error)
         return errors
 
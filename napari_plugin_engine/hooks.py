@@ -3,7 +3,8 @@ Internal hook annotation, representation and calling machinery.
 """
 import warnings
 from collections.abc import Sequence
-from typing import Any, Callable, List, Optional, Union
+from itertools import chain
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 from .callers import HookCallError, HookResult, _multicall
 from .exceptions import PluginCallError
@@ -124,6 +125,10 @@ class HookCaller:
         # Order is important for _hookexec
         return self._nonwrappers + self._wrappers
 
+    def _iter_hookimpls(self) -> Iterator[HookImplementation]:
+        """Iterate over implementations in the order of ``get_hookimpls``."""
+        return chain(self._nonwrappers, self._wrappers)
+
     def _add_hookimpl(self, hookimpl: HookImplementation):
         """Add an implementation to the callback chain."""
         if hookimpl.hookwrapper:
@@ -200,7 +205,7 @@ class HookCaller:
         try:
             return next(
                 imp
-                for imp in self.get_hookimpls()
+                for imp in self._iter_hookimpls()
                 if imp.plugin_name == plugin_name
             )
         except StopIteration:
@@ -402,11 +407,10 @@ class HookCaller:
         # pluggy only allows calling hooks with keyword arguments
         if args:
             raise TypeError("hook calling supports only keyword arguments")
-        _args: List[Any] = []
         # this converts kwargs into positional arguments in the correct order
         # for the hookspec
         try:
-            _args = [kwargs[argname] for argname in implementation.argnames]
+            _args = implementation._get_args(kwargs)
         except KeyError:
             for argname in implementation.argnames:
                 if argname not in kwargs:
@@ -457,7 +461,12 @@ class HookCaller:
         #         'No hook implementations registered for this hook caller!'
         #     )
         self._check_call_kwargs(kwargs)
-        impls = [imp for imp in self.get_hookimpls() if imp not in _skip_impls]
+        if _skip_impls:
+            impls = [
+                imp for imp in self._iter_hookimpls() if imp not in _skip_impls
+            ]
+        else:
+            impls = self.get_hookimpls()
         return self._hookexec(self, impls, kwargs)
 
     def __call__(
@@ -1,6 +1,9 @@
 import inspect
 import sys
-from typing import Any, Callable, Optional
+import weakref
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Optional, Sequence, Tuple
 
 
 class HookImplementation:
@@ -8,6 +11,21 @@ class HookImplementation:
 
     TAG_SUFFIX = "_impl"
 
+    __slots__ = (
+        'function',
+        'argnames',
+        'kwargnames',
+        '_get_args',
+        'plugin',
+        'plugin_name',
+        'hookwrapper',
+        'optionalhook',
+        'tryfirst',
+        'trylast',
+        '_specname',
+        'enabled',
+    )
+
     def __init__(
         self,
         function: Callable,
@@ -22,6 +40,8 @@ class HookImplementation:
     ):
         self.function = function
         self.argnames, self.kwargnames = varnames(self.function)
+        # pulls the positional arguments for ``function`` out of a kwargs dict
+        self._get_args = _args_getter(self.argnames)
         self.plugin = plugin
         self.plugin_name = plugin_name
         self.hookwrapper = hookwrapper
@@ -32,6 +52,7 @@ class HookImplementation:
         self.enabled = enabled
 
     @classmethod
+    @lru_cache(maxsize=8)
     def format_tag(cls, project_name):
         return project_name + cls.TAG_SUFFIX
 
@@ -93,11 +114,14 @@ class HookSpecification:
                 raise ValueError(
                     f'Hook specifications may not have argument: "{reserved}".'
                 )
+        # for validating hook implementation arguments against the spec
+        self._argnames_set = frozenset(self.argnames)
         self.firstresult = firstresult
         self.historic = historic
         self.warn_on_impl = warn_on_impl
 
     @classmethod
+    @lru_cache(maxsize=8)
     def format_tag(cls, project_name):
         return project_name + cls.TAG_SUFFIX
 
@@ -123,6 +147,30 @@ class HookSpecification:
         )
 
 
+def _args_getter(argnames: Sequence[str]) -> Callable[[dict], Tuple]:
+    """Return a function that maps a kwargs dict to a tuple of ``argnames``.
+
+    The returned function raises ``KeyError`` if any name is missing.
+    """
+    if not argnames:
+        return lambda kwargs: ()
+    if len(argnames) == 1:
+        # itemgetter with a single item does not return a tuple
+        name = argnames[0]
+        return lambda kwargs: (kwargs[name],)
+    return itemgetter(*argnames)
+
+
+# pypy3 uses "obj" instead of "self" for default dunder methods
+_PYPY3 = hasattr(sys, "pypy_version_info") and sys.version_info.major == 3
+_IMPLICIT_NAMES = ("self",) if not _PYPY3 else ("self", "obj")
+
+# fallback cache for callables that cannot store "_varnames" in their __dict__
+_varnames_cache: 'weakref.WeakKeyDictionary[Any, Tuple]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
 # TODO: can this be improved?
 def varnames(func):
     """Return tuple of positional and keywrord argument names for a function,
@@ -132,10 +180,15 @@ def varnames(func):
     For methods the ``self`` parameter is not included.
     """
     cache = getattr(func, "__dict__", {})
-    try:
-        return cache["_varnames"]
-    except KeyError:
-        pass
+    cached = cache.get("_varnames")
+    if cached is None:
+        try:
+            cached = _varnames_cache.get(func)
+        except TypeError:  # not weak-referenceable
+            pass
+    if cached is not None:
+        return cached
+    original = func
 
     if inspect.isclass(func):
         try:
@@ -148,12 +201,19 @@ def varnames(func):
         except Exception:
             return (), ()
 
-    try:  # func MUST be a function or method here or we won't parse any args
-        spec = inspect.getfullargspec(func)
-    except TypeError:
-        return (), ()
-
-    args, defaults = tuple(spec.args), spec.defaults
+    code = getattr(func, "__code__", None)
+    if code is not None and getattr(func, "__signature__", None) is None:
+        # plain python function or method: read the code object directly
+        # rather than building a full signature with getfullargspec
+        args = code.co_varnames[: code.co_argcount]
+        defaults = getattr(func, "__defaults__", None)
+    else:
+        # func MUST be a function or method here or we won't parse any args
+        try:
+            spec = inspect.getfullargspec(func)
+        except TypeError:
+            return (), ()
+        args, defaults = tuple(spec.args), spec.defaults
     if defaults:
         index = -len(defaults)
         args, kwargs = args[:index], tuple(args[index:])
@@ -161,18 +221,19 @@ def varnames(func):
         kwargs = ()
 
     # strip any implicit instance arg
-    # pypy3 uses "obj" instead of "self" for default dunder methods
-    _PYPY3 = hasattr(sys, "pypy_version_info") and sys.version_info.major == 3
-    implicit_names = ("self",) if not _PYPY3 else ("self", "obj")
     if args:
         if inspect.ismethod(func) or (
-            "." in getattr(func, "__qualname__", ())
-            and args[0] in implicit_names
+            "." in getattr(func, "__qualname__", "")
+            and args[0] in _IMPLICIT_NAMES
         ):
             args = args[1:]
 
     try:
         cache["_varnames"] = args, kwargs
     except TypeError:
-        pass
+        # e.g. classes, builtins, or objects with __slots__
+        try:
+            _varnames_cache[original] = args, kwargs
+        except TypeError:
+            pass
     return args, kwargs
@@ -5,15 +5,26 @@ import os
 import re
 import sys
 import warnings
+from collections import defaultdict
 from contextlib import contextmanager
 from logging import getLogger
 from pathlib import Path
+from types import (
+    BuiltinFunctionType,
+    FunctionType,
+    MemberDescriptorType,
+    ModuleType,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
+    DefaultDict,
     Dict,
     Generator,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -24,9 +35,10 @@ from typing import (
 from . import _tracing
 from .callers import HookResult
 from .dist import (
+    _distributions,
+    _importlib_metadata,
     _top_level_module_to_dist,
     get_metadata,
-    importlib_metadata,
     standard_metadata,
 )
 from .exceptions import (
@@ -41,9 +53,24 @@ from .hooks import HookCaller, HookExecFunc
 from .implementation import HookImplementation, HookSpecification
 from .markers import HookImplementationMarker, HookSpecificationMarker
 
+if TYPE_CHECKING:
+    from .dist import importlib_metadata
+
 logger = getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    # ``importlib_metadata`` used to be imported here eagerly
+    if name == 'importlib_metadata':
+        return _importlib_metadata()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ is not supported before python 3.7
+    globals()['importlib_metadata'] = _importlib_metadata()
+
+
 class PluginManager:
     """Core class which manages registration of plugin objects and hook calls.
 
@@ -112,17 +139,29 @@ class PluginManager:
         #:
         #: :class:`HookCaller` s get added in :meth:`~PluginManager.register`
         self._plugin2hookcallers: Dict[Any, List[HookCaller]] = {}
+        #: dict : mapping of ``plugin_name`` → list of (specname, hookimpl)
+        self._plugin2hookimpls: Dict[
+            str, List[Tuple[str, HookImplementation]]
+        ] = {}
 
+        # id(plugin) -> plugin_name, for fast lookups in get_name
+        self._plugin_names: Dict[int, str] = {}
         self._blocked: Set[str] = set()
         # multiple plugins might register the same entry point
         # _id_counts tracks the count of each identical entry point
         self._id_counts: Dict[str, int] = {}
+        # bumped whenever plugins or hookspecs change, used to invalidate the
+        # cached output of plugin_info, list_plugin_metadata and __str__
+        self._registration_version: int = 0
+        self._plugin_info_cache: Dict[str, str] = {}
+        self._plugin_metadata_cache: Optional[
+            Tuple[int, List[Dict[str, Any]]]
+        ] = None
+        self._sorted_plugin_names: Optional[List[str]] = None
 
         self.trace = _tracing.TagTracer().get("pluginmanage")
         self.hook = _HookRelay(self)
-        self._inner_hookexec: HookExecFunc = lambda c, m, k: c.multicall(
-            m, k, firstresult=c.is_firstresult
-        )
+        self._inner_hookexec: HookExecFunc = _direct_hookexec
 
     @property
     def hooks(self) -> '_HookRelay':
@@ -159,7 +198,13 @@ class PluginManager:
         :class:`~napari_plugin_engine.HookResult`
             The result object produced by the multicall loop.
         """
-        return self._inner_hookexec(caller, methods, kwargs)
+        inner = self._inner_hookexec
+        if inner is _direct_hookexec:
+            # no monitoring: skip the extra call frame
+            return caller.multicall(
+                methods, kwargs, firstresult=caller.is_firstresult
+            )
+        return inner(caller, methods, kwargs)
 
     def iter_available(
         self,
@@ -239,43 +284,59 @@ class PluginManager:
 
         errs: List[PluginError] = []
         count = 0
-        for name, mod_name, dist_name in self.iter_available(
-            path, entry_point, prefix
-        ):
-            old_name = name
-            # different plugin has already registered this entry point
-            if self.is_registered(name):
-                mod_names = (
-                    plugin_mod.__name__ for plugin_mod in self.plugins.values()
-                )
-                # we may have registered this entry point under a different name,
-                # so check module names to avoid duplicate registration
-                if mod_name in mod_names:
+        # (name, previously registered module, new name) for each entry point
+        # name that was already taken.  Reported in a single warning below.
+        collisions: List[Tuple[str, str, str]] = []
+        plugins = self.plugins
+        blocked = self._blocked
+        try:
+            for name, mod_name, dist_name in self.iter_available(
+                path, entry_point, prefix
+            ):
+                old_name = name
+                # different plugin has already registered this entry point
+                if name in plugins:
+                    mod_names = (
+                        plugin_mod.__name__ for plugin_mod in plugins.values()
+                    )
+                    # we may have registered this entry point under a
+                    # different name, so check module names to avoid
+                    # duplicate registration
+                    if mod_name in mod_names:
+                        continue
+                    new_name = f"{name}-{self._id_counts[name]}"
+                    previously_registered_mod = plugins[name].__name__
+                    collisions.append(
+                        (name, previously_registered_mod, new_name)
+                    )
+                    name = new_name
+                elif name in blocked:
                     continue
-                new_name = f"{name}-{self._id_counts[name]}"
-                previously_registered_mod = self.plugins[name].__name__
+
+                try:
+                    if self._load_and_register(mod_name, name):
+                        count += 1
+                        self._id_counts[name] = 1
+                        self._id_counts[old_name] += 1
+                except PluginError as e:
+                    errs.append(e)
+                    # commenting out for now, because napari stores this
+                    # blockage too permanently, and it's hard to differentiate
+                    # between plugins intentionally blocked by the user.
+                    # self.set_blocked(name)
+                    if ignore_errors:
+                        continue
+                    raise e
+        finally:
+            if collisions:
                 warnings.warn(
-                    f"Plugin {name} already registered by module "
-                    + f"{previously_registered_mod}! Registering as {new_name}."
+                    "Plugin name collisions: "
+                    + "; ".join(
+                        f"Plugin {name} already registered by module {mod}! "
+                        f"Registering as {new_name}."
+                        for name, mod, new_name in collisions
+                    )
                 )
-                name = new_name
-            elif self.is_blocked(name):
-                continue
-
-            try:
-                if self._load_and_register(mod_name, name):
-                    count += 1
-                    self._id_counts[name] = 1
-                    self._id_counts[old_name] += 1
-            except PluginError as e:
-                errs.append(e)
-                # commenting out for now, because napari stores this blockage
-                # too permanently, and it's hard to differentiate between
-                # plugins intentionally blocked by the user.
-                # self.set_blocked(name)
-                if ignore_errors:
-                    continue
-                raise e
 
         return count, errs
 
@@ -385,16 +446,22 @@ class PluginManager:
             raise ValueError(f"Plugin module already registered: {namespace}")
 
         hookcallers = []
+        hookimpls: List[Tuple[str, HookImplementation]] = []
+        # hookimpls for hooks without a HookCaller yet.  These are only
+        # parked in self.hook._pending once all hookimpls have been verified.
+        pending: List[HookImplementation] = []
         for hookimpl in iter_implementations(namespace, self.project_name):
             hookimpl.plugin_name = plugin_name
-            hook_caller = getattr(self.hook, hookimpl.specname, None)
-            # if we don't yet have a hookcaller by this name, create one.
+            hookimpls.append((hookimpl.specname, hookimpl))
+            hook_caller = self.hook.__dict__.get(hookimpl.specname)
+            # if we don't yet have a hookcaller by this name, park the
+            # hookimpl until the hook is first accessed (see _HookRelay).
             if hook_caller is None:
-                hook_caller = HookCaller(hookimpl.specname, self._hookexec)
-                setattr(self.hook, hookimpl.specname, hook_caller)
+                pending.append(hookimpl)
+                continue
             # otherwise, if it has a specification, validate the new
             # hookimpl against the specification.
-            elif hook_caller.has_spec():
+            if hook_caller.has_spec():
                 self._verify_hook(hook_caller, hookimpl)
                 hook_caller._maybe_apply_history(hookimpl)
             # Finally, add the hookimpl to the hook_caller and the hook
@@ -402,8 +469,11 @@ class PluginManager:
             hook_caller._add_hookimpl(hookimpl)
             hookcallers.append(hook_caller)
 
+        for hookimpl in pending:
+            self.hook._pending[hookimpl.specname].append(hookimpl)
         self._plugin2hookcallers[namespace] = hookcallers
-        if not hookcallers:
+        self._plugin2hookimpls[plugin_name] = hookimpls
+        if not (hookcallers or pending):
             ns_name = get_canonical_name(namespace)
             warnings.warn(
                 f"Module {ns_name!r} from plugin {plugin_name!r} has no hooks! "
@@ -411,8 +481,16 @@ class PluginManager:
                 "If you are a developer, please check your entry point."
             )
         self.plugins[plugin_name] = namespace
+        self._plugin_names[id(namespace)] = plugin_name
+        self._bump_registration_version()
         return plugin_name
 
+    def _bump_registration_version(self):
+        """Invalidate cached plugin info after a registration change."""
+        self._registration_version += 1
+        self._plugin_info_cache.clear()
+        self._sorted_plugin_names = None
+
     def _register_dict(
         self, dct: Dict[str, Callable], name: Optional[str] = None, **kwargs
     ) -> Optional[str]:
@@ -442,6 +520,9 @@ class PluginManager:
 
     def get_name(self, plugin):
         """Return name for registered plugin or ``None`` if not registered."""
+        name = self._plugin_names.get(id(plugin))
+        if name is not None and self.plugins.get(name) is plugin:
+            return name
         for name, val in self.plugins.items():
             if plugin == val:
                 return name
@@ -499,10 +580,15 @@ class PluginManager:
             warnings.warn(str(e))
             return None
 
-        del self.plugins[self.get_name(plugin)]
+        plugin_name = self.get_name(plugin)
+        del self.plugins[plugin_name]
+        self._plugin_names.pop(id(plugin), None)
+        self._plugin2hookimpls.pop(plugin_name, None)
 
         for hookcaller in self._plugin2hookcallers.pop(plugin, []):
             hookcaller._remove_plugin(plugin)
+        self.hook._discard_pending(plugin)
+        self._bump_registration_version()
 
         return plugin
 
@@ -511,7 +597,10 @@ class PluginManager:
 
         Useful if pip uninstall has been run during the session.
         """
-        _top_level_module_to_dist.cache_clear()
+        clear_plugin_cache()
+        load.cache_clear()
+        # cached plugin info holds the versions of the previous install
+        self._bump_registration_version()
         for plugin_module in list(self.plugins.values()):
             try:
                 importlib.reload(plugin_module)
@@ -538,27 +627,31 @@ class PluginManager:
             return self._add_hookspec_dict(namespace)
 
         names = []
-        for name in dir(namespace):
-            method = getattr(namespace, name)
-            if not inspect.isroutine(method):
+        hook_relay = self.hook
+        hook_dict = hook_relay.__dict__
+        for kind, name, _, spec_opts in _scan_namespace(
+            namespace, self.project_name
+        ):
+            if kind != 'spec':
                 continue
-
-            tag = HookSpecification.format_tag(self.project_name)
-            spec_opts = getattr(method, tag, None)
-            if spec_opts is not None:
-                hook_caller = getattr(self.hook, name, None)
-                if hook_caller is None:
-                    hook_caller = HookCaller(
-                        name, self._hookexec, namespace, spec_opts
-                    )
-                    setattr(self.hook, name, hook_caller)
-                else:
-                    # plugins registered this hook without knowing the spec
-                    hook_caller.set_specification(namespace, spec_opts)
-                    for hookfunction in hook_caller.get_hookimpls():
-                        self._verify_hook(hook_caller, hookfunction)
-                names.append(name)
-
+            hook_caller = hook_dict.get(name)
+            if hook_caller is None and name in hook_relay._pending:
+                # create the HookCaller for hookimpls registered before now
+                hook_caller = getattr(hook_relay, name)
+            if hook_caller is None:
+                hook_caller = HookCaller(
+                    name, self._hookexec, namespace, spec_opts
+                )
+                setattr(hook_relay, name, hook_caller)
+            else:
+                # plugins registered this hook without knowing the spec
+                hook_caller.set_specification(namespace, spec_opts)
+                hook_relay._unverified.discard(name)
+                for hookfunction in hook_caller._iter_hookimpls():
+                    self._verify_hook(hook_caller, hookfunction)
+            names.append(name)
+
+        self._bump_registration_version()
         if not names:
             raise ValueError(
                 f"did not find any {self.project_name!r} hooks in {namespace!r}"
@@ -592,6 +685,7 @@ class PluginManager:
         else:
             if plugin_name in self._blocked:
                 self._blocked.remove(plugin_name)
+        self._bump_registration_version()
 
     def get_errors(
         self,
@@ -654,22 +748,25 @@ class PluginManager:
                 f"{hook_caller.name!r}\nhistoric incompatible to hookwrapper",
             )
 
-        if not hook_caller.spec:
+        spec = hook_caller.spec
+        if not spec:
             return
 
         # If the hookspec has ``warn_on_impl`` flag show a warning.
-        if hook_caller.spec.warn_on_impl:
+        warn_on_impl = spec.warn_on_impl
+        if warn_on_impl:
+            code = hookimpl.function.__code__
             warnings.warn_explicit(
-                hook_caller.spec.warn_on_impl,
-                type(hook_caller.spec.warn_on_impl),
-                lineno=hookimpl.function.__code__.co_firstlineno,
-                filename=hookimpl.function.__code__.co_filename,
+                warn_on_impl,
+                type(warn_on_impl),
+                lineno=code.co_firstlineno,
+                filename=code.co_filename,
             )
 
         # If there are any argument names in the hookimpl that are not
         # in the hook specification.
-        notinspec = set(hookimpl.argnames) - set(hook_caller.spec.argnames)
-        if notinspec:
+        if not spec._argnames_set.issuperset(hookimpl.argnames):
+            notinspec = set(hookimpl.argnames).difference(spec._argnames_set)
             raise PluginValidationError(
                 hookimpl,
                 f"Plugin {hookimpl.plugin_name!r} for hook {hook_caller.name!r}"
@@ -687,21 +784,26 @@ class PluginManager:
             If a hook implementation that was *not* marked as ``optionalhook``
             has been registered for a non-existent hook specification.
         """
-        for name in self.hook.__dict__:
-            if name.startswith("_"):
-                continue
-            hook = getattr(self.hook, name)
-            if not hook.has_spec():
-                for hookimpl in hook.get_hookimpls():
-                    if not hookimpl.optionalhook:
-                        raise PluginValidationError(
-                            hookimpl,
-                            f"unknown hook {name!r} in "
-                            f"plugin {hookimpl.plugin!r}",
-                        )
+        hooks = self.hook._public_hooks
+        unspecified = [
+            (name, hooks[name].get_hookimpls())
+            for name in self.hook._unverified
+            if not hooks[name].has_spec()
+        ]
+        # hookimpls that have not yet been given a HookCaller never have a spec
+        unspecified.extend(self.hook._pending.items())
+        for name, hookimpls in unspecified:
+            for hookimpl in hookimpls:
+                if not hookimpl.optionalhook:
+                    raise PluginValidationError(
+                        hookimpl,
+                        f"unknown hook {name!r} in "
+                        f"plugin {hookimpl.plugin!r}",
+                    )
 
     def get_hookcallers(self, plugin: Any) -> Optional[List[HookCaller]]:
         """get all hook callers for the specified plugin."""
+        self.hook._flush_pending()
         return self._plugin2hookcallers.get(plugin)
 
     def add_hookcall_monitoring(
@@ -826,7 +928,7 @@ class PluginManager:
         plugin_name = self.get_name(plugin)
         # TODO: is there no better API for this already?
         hooks = []
-        for caller in self._plugin2hookcallers[plugin]:
+        for caller in self.get_hookcallers(plugin) or []:
             try:
                 impl = caller.get_plugin_implementation(plugin_name)
                 hooks.append(impl.specname)
@@ -846,19 +948,30 @@ class PluginManager:
             guaranteed to have the following keys mentioned in
             :meth:`~PluginManager.get_standard_metadata`
         """
-        return [
-            self.get_standard_metadata(plugin)
-            for plugin in self._plugin2hookcallers
-        ]
+        cache = self._plugin_metadata_cache
+        if cache is None or cache[0] != self._registration_version:
+            metadata = [
+                self.get_standard_metadata(plugin)
+                for plugin in self._plugin2hookcallers
+            ]
+            cache = (self._registration_version, metadata)
+            self._plugin_metadata_cache = cache
+        # copy the hooks lists too, so callers cannot modify the cache
+        return [dict(meta, hooks=list(meta['hooks'])) for meta in cache[1]]
 
     def __str__(self) -> str:
         nhooks = len(self.hooks)
         nplug = len(self.plugins)
-        text = f'PluginManager for "{self.project_name}"\n'
-        text += f'({nhooks} hook specs and {nplug} plugins)\n'
-        text += '-' * 45 + '\n'
-        for name, plugin in sorted(self.plugins.items(), key=lambda x: x[0]):
-            text += self.plugin_info(plugin) + "\n"
+        lines = [
+            f'PluginManager for "{self.project_name}"',
+            f'({nhooks} hook specs and {nplug} plugins)',
+            '-' * 45,
+        ]
+        names = self._sorted_plugin_names
+        if names is None:
+            names = self._sorted_plugin_names = sorted(self.plugins)
+        lines.extend(self.plugin_info(self.plugins[name]) for name in names)
+        text = '\n'.join(lines) + '\n'
 
         if self._blocked:
             text += '\nBlocked Plugins:\n----------------\n'
@@ -868,25 +981,33 @@ class PluginManager:
     def plugin_info(self, plugin) -> str:
         plugin = self._ensure_plugin(plugin)
         plugin_name = self.get_name(plugin)
+        if plugin_name in self._plugin_info_cache:
+            return self._plugin_info_cache[plugin_name]
         version = self.get_metadata(plugin, 'version')
-        hooks = self._plugin2hookcallers[plugin]
+        hooks = self.get_hookcallers(plugin) or []
         name = f'{plugin_name} v{version}'
-        text = f'{name:45}  {len(hooks):3} hooks\n'
-        for specname, hook_caller in self.hooks.items():
-            for impl in hook_caller.get_hookimpls():
-                if impl.plugin_name == plugin_name:
-                    funcname = ''
-                    if impl.function.__name__ != specname:
-                        funcname = (
-                            f'{impl.function.__module__}.'
-                            f'{impl.function.__name__}'
-                        )
-                    text += f"  - {specname:28} {funcname}\n"
+        lines = [f'{name:45}  {len(hooks):3} hooks']
+        for specname, impl in self._plugin2hookimpls.get(plugin_name, ()):
+            funcname = ''
+            if impl.function.__name__ != specname:
+                funcname = (
+                    f'{impl.function.__module__}.{impl.function.__name__}'
+                )
+            lines.append(f"  - {specname:28} {funcname}")
+        text = '\n'.join(lines) + '\n'
+        self._plugin_info_cache[plugin_name] = text
         return text
 
 
+def _direct_hookexec(
+    caller: HookCaller, methods: List[HookImplementation], kwargs: dict
+) -> HookResult:
+    """Default ``PluginManager._inner_hookexec``: call ``methods`` directly."""
+    return caller.multicall(methods, kwargs, firstresult=caller.is_firstresult)
+
+
 def _formatdef(func):
-    return f"{func.__name__}{str(inspect.signature(func))}"
+    return f"{func.__name__}{inspect.signature(func)}"
 
 
 class _HookRelay:
@@ -898,40 +1019,119 @@ class _HookRelay:
     the parent plugin_manager. Note that ``PluginManager.__init__`` sets
     ``self.hook._needs_discovery = True`` *after* hook_specifications and
     builtins have been discovered, but before external plugins are loaded.
+
+    Until discovery has run, the relay's class is
+    :class:`_UndiscoveredHookRelay`, whose ``__getattribute__`` performs the
+    check.  Afterwards it is switched back to this class, so that later hook
+    access pays no discovery check.
+
+    Hook implementations registered for a hook that does not yet have a
+    :class:`HookCaller` are parked in ``self._pending``, and the ``HookCaller``
+    is only created when the hook is first accessed (or when a matching hook
+    specification is added).
     """
 
     def __init__(self, manager: PluginManager):
+        # mirror of all public (HookCaller) attributes, see __setattr__
+        self._public_hooks: Dict[str, HookCaller] = {}
+        # names of public hooks that were added without a specification
+        self._unverified: Set[str] = set()
         self._manager = manager
         self._needs_discovery = True
+        self._pending: DefaultDict[
+            str, List[HookImplementation]
+        ] = defaultdict(list)
 
-    def __getattribute__(self, name) -> HookCaller:
-        """Trigger manager plugin discovery when accessing hook first time."""
-        if name not in ("_needs_discovery", "_manager"):
-            if self._needs_discovery:
-                self._manager.discover()
-        return object.__getattribute__(self, name)
+    @property
+    def _needs_discovery(self) -> bool:
+        """Whether accessing a hook will trigger plugin discovery."""
+        return issubclass(type(self), _UndiscoveredHookRelay)
+
+    @_needs_discovery.setter
+    def _needs_discovery(self, value: bool):
+        self.__class__ = _UndiscoveredHookRelay if value else _HookRelay
+
+    def __getattr__(self, name: str) -> HookCaller:
+        """Create the HookCaller for pending hook implementations on demand."""
+        pending = object.__getattribute__(self, '_pending')
+        if name not in pending:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        manager = object.__getattribute__(self, '_manager')
+        hook_caller = HookCaller(name, manager._hookexec)
+        for hookimpl in pending.pop(name):
+            hook_caller._add_hookimpl(hookimpl)
+            manager._plugin2hookcallers[hookimpl.plugin].append(hook_caller)
+        setattr(self, name, hook_caller)
+        return hook_caller
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name.startswith("_"):
+            return
+        if isinstance(value, HookCaller):
+            self._public_hooks[name] = value
+            if value.has_spec():
+                self._unverified.discard(name)
+            else:
+                self._unverified.add(name)
+        else:
+            self._public_hooks.pop(name, None)
+            self._unverified.discard(name)
+
+    def __delattr__(self, name: str):
+        object.__delattr__(self, name)
+        self._public_hooks.pop(name, None)
+        self._unverified.discard(name)
+
+    def _flush_pending(self):
+        """Create HookCallers for all pending hook implementations."""
+        for name in list(self._pending):
+            getattr(self, name)
+
+    def _discard_pending(self, plugin: Any):
+        """Drop all pending hook implementations provided by ``plugin``."""
+        for name, hookimpls in list(self._pending.items()):
+            hookimpls[:] = [imp for imp in hookimpls if imp.plugin != plugin]
+            if not hookimpls:
+                del self._pending[name]
 
     def __str__(self) -> str:
-        text = ''
-        for hookname, hookcaller in sorted(self.items(), key=lambda x: x[0]):
-            text += (
-                f'{hookname:25}  {len(hookcaller.get_hookimpls()):3}'
-                ' implementations\n'
-            )
-        return text
+        self._flush_pending()
+        hooks = self._public_hooks
+        return ''.join(
+            f'{name:25}  {len(hooks[name].get_hookimpls()):3}'
+            ' implementations\n'
+            for name in sorted(hooks)
+        )
 
     def __len__(self) -> int:
-        return len([k for k in vars(self) if not k.startswith("_")])
+        self._flush_pending()
+        return len(self._public_hooks)
 
     def items(self) -> List[Tuple[str, HookCaller]]:
         """Iterate through hookcallers, removing private attributes."""
-        return [
-            (k, val) for k, val in vars(self).items() if not k.startswith("_")
-        ]
+        self._flush_pending()
+        return list(self._public_hooks.items())
 
     def values(self) -> List[HookCaller]:
         """Iterate through hookcallers, removing private attributes."""
-        return [val for k, val in vars(self).items() if not k.startswith("_")]
+        self._flush_pending()
+        return list(self._public_hooks.values())
+
+
+class _UndiscoveredHookRelay(_HookRelay):
+    """A :class:`_HookRelay` for which plugin discovery has not yet run."""
+
+    def __getattribute__(self, name) -> HookCaller:
+        """Trigger manager plugin discovery when accessing hook first time."""
+        # ``discover()`` swaps the class back to _HookRelay, removing this
+        # override once discovery has been triggered.
+        if name not in ("_needs_discovery", "_manager"):
+            if self._needs_discovery:
+                self._manager.discover()
+        return object.__getattribute__(self, name)
 
 
 def get_canonical_name(namespace: Any) -> str:
@@ -942,25 +1142,154 @@ def get_canonical_name(namespace: Any) -> str:
     <.PluginManager.register>`. To obtain the name of a registered plugin
     use :meth:`get_name(plugin) <.PluginManager.get_name>` instead.
     """
-    return getattr(namespace, "__name__", None) or str(id(namespace))
+    try:
+        name = namespace.__name__
+    except AttributeError:
+        return str(id(namespace))
+    return name or str(id(namespace))
+
+
+def _iter_routines(namespace: Any) -> Iterator[Tuple[str, Callable]]:
+    """Yield ``(name, routine)`` for all routines available on ``namespace``.
+
+    This walks the ``__dict__`` of ``namespace`` (and of every class in its
+    MRO) rather than calling ``dir()``, so dunder attributes are skipped
+    without a lookup and non-routine attributes (such as properties) are never
+    evaluated.  Instance attributes stored in ``__slots__`` are looked up
+    through their member descriptors.  Names are yielded in sorted order, as
+    with ``dir()``.
+    """
+    dicts: List[Mapping[str, Any]]
+    candidates: Tuple[type, ...] = (staticmethod, classmethod)
+    if inspect.ismodule(namespace):
+        dicts = [vars(namespace)]
+    else:
+        is_class = isinstance(namespace, type)
+        cls = namespace if is_class else type(namespace)
+        dicts = [vars(klass) for klass in cls.__mro__]
+        instance_dict = (
+            None if is_class else getattr(namespace, '__dict__', None)
+        )
+        if isinstance(instance_dict, dict):
+            dicts.insert(0, instance_dict)
+        if not is_class:
+            candidates += (MemberDescriptorType,)
+
+    seen = set()
+    names = []
+    for dct in dicts:
+        for name, value in dct.items():
+            if name in seen or (name[:2] == '__' and name[-2:] == '__'):
+                continue
+            seen.add(name)
+            if inspect.isroutine(value) or isinstance(value, candidates):
+                names.append(name)
+
+    for name in sorted(names):
+        # use getattr so that the routine is bound as it would be on access
+        # (unset slots raise AttributeError)
+        method = getattr(namespace, name, None)
+        if inspect.isroutine(method):
+            yield name, method
+
+
+def _iter_module_routines(module: Any) -> Iterator[Tuple[str, Callable]]:
+    """Yield ``(name, routine)`` for routines in ``module`` that may be marked.
+
+    Module plugins often contain many imported names, so builtins and plain
+    functions with an empty ``__dict__`` (which therefore carry no marker
+    options) are skipped without further inspection.  Names are yielded in
+    sorted order.
+    """
+    routines = []
+    for name, value in vars(module).items():
+        if name[:2] == '__' and name[-2:] == '__':
+            continue
+        value_type = type(value)
+        if value_type is FunctionType:
+            if not value.__dict__:
+                continue
+        elif value_type is BuiltinFunctionType or not inspect.isroutine(value):
+            continue
+        routines.append((name, value))
+    routines.sort(key=lambda item: item[0])
+    return iter(routines)
+
+
+def _iter_dir_routines(namespace: Any) -> Iterator[Tuple[str, Callable]]:
+    """Yield ``(name, routine)`` for all routines listed by ``dir(namespace)``.
+
+    This is the slow path for namespaces that provide attributes through
+    ``__getattr__`` or ``__dir__``, which never show up in their ``__dict__``.
+    """
+    for name in dir(namespace):
+        method = getattr(namespace, name)
+        if inspect.isroutine(method):
+            yield name, method
+
+
+def _has_dynamic_attributes(namespace: Any) -> bool:
+    """Whether ``namespace`` defines ``__getattr__`` or a custom ``__dir__``.
+
+    This includes modules using module level ``__getattr__`` and ``__dir__``
+    functions (:pep:`562`), as lazily loading packages do.
+    """
+    if inspect.ismodule(namespace):
+        module_dict = vars(namespace)
+        if '__getattr__' in module_dict or '__dir__' in module_dict:
+            return True
+    cls = type(namespace)
+    return hasattr(cls, '__getattr__') or cls.__dir__ not in (
+        object.__dir__,
+        type.__dir__,
+        ModuleType.__dir__,
+    )
+
+
+def _scan_namespace(
+    namespace: Any, project_name: str
+) -> Iterator[Tuple[str, str, Callable, dict]]:
+    """Yield ``(kind, name, function, opts)`` for marked routines in namespace.
+
+    ``kind`` is ``'spec'`` for functions marked with a
+    :class:`HookSpecificationMarker` and ``'impl'`` for those marked with a
+    :class:`HookImplementationMarker` using ``project_name``.  Both markers are
+    checked during a single walk of the namespace attributes.
+    """
+    spec_tag = HookSpecification.format_tag(project_name)
+    impl_tag = HookImplementation.format_tag(project_name)
+    if _has_dynamic_attributes(namespace):
+        routines = _iter_dir_routines(namespace)
+    elif inspect.ismodule(namespace):
+        routines = _iter_module_routines(namespace)
+    else:
+        routines = _iter_routines(namespace)
+    for name, method in routines:
+        # markers store their options in the function __dict__ (bound methods
+        # proxy to ``__func__``), so probe it directly rather than paying for
+        # a failed attribute lookup on every unmarked routine.
+        attrs = getattr(getattr(method, '__func__', method), '__dict__', None)
+        if isinstance(attrs, dict):
+            spec_opts = attrs.get(spec_tag)
+            impl_opts = attrs.get(impl_tag)
+        else:
+            spec_opts = getattr(method, spec_tag, None)
+            impl_opts = getattr(method, impl_tag, None)
+        if spec_opts is not None:
+            yield 'spec', name, method, spec_opts
+        if isinstance(impl_opts, dict) and impl_opts:
+            yield 'impl', name, method, impl_opts
 
 
 def iter_implementations(
     namespace, project_name: str
 ) -> Generator[HookImplementation, None, None]:
     # register matching hook implementations of the plugin
-    for name in dir(namespace):
-        # check all attributes/methods of plugin and look for functions or
-        # methods that have a "{self.project_name}_impl" attribute.
-        method = getattr(namespace, name)
-        if not inspect.isroutine(method):
-            continue
-        tag = HookImplementation.format_tag(project_name)
-        hookimpl_opts = getattr(method, tag, None)
-        if not (isinstance(hookimpl_opts, dict) and hookimpl_opts):
-            # false positive
+    for kind, _, method, hookimpl_opts in _scan_namespace(
+        namespace, project_name
+    ):
+        if kind != 'impl':
             continue
-
         # create the HookImplementation instance for this method
         try:
             yield HookImplementation(method, namespace, **hookimpl_opts)
@@ -996,7 +1325,7 @@ def ensure_namespace(obj: Any, name: str = 'orphan') -> Type:
         <https://docs.python.org/3.3/reference/lexical_analysis.html#identifiers>`_.
     """
     if isinstance(obj, dict):
-        bad_keys = [str(k) for k in obj.keys() if not str(k).isidentifier()]
+        bad_keys = [k for k in map(str, obj) if not k.isidentifier()]
         if bad_keys:
             raise ValueError(
                 f"dict contained invalid identifiers: {', '.join(bad_keys)}"
@@ -1022,14 +1351,16 @@ def temp_path_additions(path: Optional[Union[str, List[str]]]) -> Generator:
     if isinstance(path, (str, Path)):
         path = [path]
     path = [os.fspath(p) for p in path] if path else []
-    to_add = [p for p in path if p not in sys.path]
-    for p in to_add:
-        sys.path.insert(0, p)
+    sys_path = sys.path
+    existing = set(sys_path)
+    to_add = [p for p in path if p not in existing]
+    # a single slice assignment, in the same order as inserting each at 0
+    sys_path[:0] = to_add[::-1]
     try:
-        yield sys.path
+        yield sys_path
     finally:
         for p in to_add:
-            sys.path.remove(p)
+            sys_path.remove(p)
 
 
 pattern = re.compile(
@@ -1039,18 +1370,177 @@ pattern = re.compile(
 )
 
 
+@functools.lru_cache(maxsize=None)
 def load(value: str):
     """Load and return a module or attribute of a module (such as a class).
 
     If only a module is indicated by the value, return that module. Otherwise,
-    return the named object.
+    return the named object.  Results are cached by ``value``; use
+    ``load.cache_clear()`` to reset the cache.
     """
-    match = pattern.match(value)
+    match = pattern.fullmatch(value)
     if not match:
         raise ValueError(f"malformed entry point string: {value}")
-    module = importlib.import_module(match.group('module'))
-    attrs = filter(None, (match.group('attr') or '').split('.'))
-    return functools.reduce(getattr, attrs, module)
+    obj = importlib.import_module(match.group('module'))
+    _getattr = getattr
+    for attr in (match.group('attr') or '').split('.'):
+        if attr:
+            obj = _getattr(obj, attr)
+    return obj
+
+
+_UNSET: Any = object()
+
+
+class _DistInfo:
+    """Discovery metadata for one distribution, each part read on first use.
+
+    Most distributions neither provide the requested entry point group nor
+    match the plugin prefix, so their name and ``top_level.txt`` are often
+    never needed.
+    """
+
+    __slots__ = ('_dist', '_name', '_entry_points', '_top_level')
+
+    def __init__(self, dist: 'importlib_metadata.Distribution'):
+        self._dist = dist
+        self._name: Optional[str] = _UNSET
+        self._entry_points: Dict[str, List[Tuple[str, str]]] = _UNSET
+        self._top_level: Tuple[str, ...] = _UNSET
+
+    @property
+    def name(self) -> Optional[str]:
+        if self._name is _UNSET:
+            self._name = self._dist.metadata.get("name")
+        return self._name
+
+    @property
+    def entry_points(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Mapping of group -> [(entry point name, entry point value)]."""
+        if self._entry_points is _UNSET:
+            entry_points: Dict[str, List[Tuple[str, str]]] = {}
+            for ep in self._dist.entry_points:
+                group = ep.group  # type: ignore
+                entry_points.setdefault(group, []).append((ep.name, ep.value))
+            self._entry_points = entry_points
+        return self._entry_points
+
+    @property
+    def top_level(self) -> Tuple[str, ...]:
+        if self._top_level is _UNSET:
+            text = self._dist.read_text('top_level.txt') or ""
+            self._top_level = tuple(filter(None, text.splitlines()))
+        return self._top_level
+
+
+# the distributions last returned by _distributions(), their _DistInfo, and
+# group -> the _DistInfo that declare entry points in that group
+_DIST_CACHE: Tuple[tuple, List[_DistInfo], Dict[str, List[_DistInfo]]] = (
+    (),
+    [],
+    {},
+)
+
+
+def _get_dist_cache() -> List[_DistInfo]:
+    """Return (cached) distribution metadata for the current ``sys.path``.
+
+    The distributions themselves are cached by ``dist._distributions()``,
+    this only wraps the ones it returned most recently.
+    """
+    global _DIST_CACHE
+    dists = _distributions()
+    if _DIST_CACHE[0] is not dists:
+        _DIST_CACHE = (dists, [_DistInfo(dist) for dist in dists], {})
+    return _DIST_CACHE[1]
+
+
+def _get_group_dists(group: str) -> List[_DistInfo]:
+    """Return (cached) distributions with entry points in ``group``."""
+    infos = _get_dist_cache()
+    groups = _DIST_CACHE[2]
+    if group not in groups:
+        groups[group] = [info for info in infos if group in info.entry_points]
+    return groups[group]
+
+
+def clear_plugin_cache():
+    """Clear the distribution metadata cached by :func:`iter_available_plugins`.
+
+    This includes the names of uninstalled modules found by prefix, and the
+    module to distribution mapping used by ``get_dist``.  Call this if
+    packages have been installed or uninstalled during the session.
+    """
+    global _DIST_CACHE
+    _DIST_CACHE = ((), [], {})
+    # also clears the distributions cached by dist._distributions()
+    _top_level_module_to_dist.cache_clear()
+    _PREFIX_MODULE_CACHE.clear()
+
+
+def _iter_prefixed_modules(prefix: str) -> Iterator[str]:
+    """Yield names of top level modules on ``sys.path`` starting with prefix.
+
+    This is equivalent to filtering the names from
+    :func:`pkgutil.iter_modules`, but for plain directories on ``sys.path``
+    only the entries whose name starts with ``prefix`` are inspected, rather
+    than every module in the environment.  Other path entries (e.g. zip
+    files) are still handed to :func:`pkgutil.iter_modules`.
+    """
+    from pkgutil import iter_modules
+
+    yielded = set()
+    for entry in sys.path:
+        directory = entry or '.'
+        if not os.path.isdir(directory):
+            for _, mod_name, _ in iter_modules([entry]):
+                if mod_name.startswith(prefix) and mod_name not in yielded:
+                    yielded.add(mod_name)
+                    yield mod_name
+            continue
+        try:
+            filenames = sorted(os.listdir(directory))
+        except OSError:
+            continue
+        for filename in filenames:
+            if not filename.startswith(prefix):
+                continue
+            # same rules as pkgutil uses for a FileFinder
+            module_name = inspect.getmodulename(filename)
+            if module_name:
+                mod_name = module_name
+            else:
+                path = os.path.join(directory, filename)
+                if '.' in filename or not os.path.isdir(path):
+                    continue
+                try:
+                    contents = os.listdir(path)
+                except OSError:
+                    continue
+                if not any(
+                    inspect.getmodulename(fn) == '__init__' for fn in contents
+                ):
+                    continue
+                mod_name = filename
+            if '.' not in mod_name and mod_name not in yielded:
+                yielded.add(mod_name)
+                yield mod_name
+
+
+# (sys.path, prefix) -> module names found by _iter_prefixed_modules.  Only
+# entries for the most recent sys.path are kept.
+_PREFIX_MODULE_CACHE: Dict[Tuple[Tuple[str, ...], str], Tuple[str, ...]] = {}
+
+
+def _get_prefixed_modules(prefix: str) -> Tuple[str, ...]:
+    """Return (cached) names of modules on ``sys.path`` starting with prefix."""
+    sys_path = tuple(sys.path)
+    key = (sys_path, prefix)
+    if key not in _PREFIX_MODULE_CACHE:
+        for stale in [k for k in _PREFIX_MODULE_CACHE if k[0] != sys_path]:
+            del _PREFIX_MODULE_CACHE[stale]
+        _PREFIX_MODULE_CACHE[key] = tuple(_iter_prefixed_modules(prefix))
+    return _PREFIX_MODULE_CACHE[key]
 
 
 def iter_available_plugins(
@@ -1099,43 +1589,45 @@ def iter_available_plugins(
     """
     if include_uninstalled is None:
         include_uninstalled = bool(prefix)
+    # the group and prefix to search for, or None if that search is disabled
+    ep_group = group if not os.getenv("DISABLE_ENTRYPOINT_PLUGINS") else None
+    prefix_disabled = bool(os.getenv("DISABLE_PREFIX_PLUGINS"))
+    name_prefix = prefix if not prefix_disabled else None
     with temp_path_additions(path):
         _seen = set()
-        for dist in importlib_metadata.distributions():
-            matched = False
-            if group and not os.getenv("DISABLE_ENTRYPOINT_PLUGINS"):
-                for ep in dist.entry_points:
-                    if ep.group == group:  # type: ignore
-                        matched = True
-                        _seen.add(ep.value.split(".", maxsplit=1)[0])
-                        yield (
-                            ep.name,
-                            ep.value,
-                            dist.metadata.get("name"),
-                        )
-            if matched:
+        if name_prefix:
+            # any distribution may provide a module matching the prefix
+            infos = _get_dist_cache()
+        elif ep_group:
+            infos = _get_group_dists(ep_group)
+        else:
+            infos = []
+        for info in infos:
+            group_eps = info.entry_points.get(ep_group) if ep_group else None
+            if group_eps:
+                name = info.name
+                for ep_name, ep_value in group_eps:
+                    _seen.add(ep_value.split(".", maxsplit=1)[0])
+                    yield (ep_name, ep_value, name)
                 continue
-            if prefix and not os.getenv("DISABLE_PREFIX_PLUGINS"):
-                name = dist.metadata.get("name")
-                if not name or name == prefix or (not name.startswith(prefix)):
+            if name_prefix:
+                name = info.name
+                if (
+                    not name
+                    or name == name_prefix
+                    or not name.startswith(name_prefix)
+                ):
                     continue
-                top_modules = dist.read_text('top_level.txt') or ""
-                for mod in filter(None, top_modules.split('\n')):
-                    if mod.startswith(prefix):
+                for mod in info.top_level:
+                    if mod.startswith(name_prefix):
                         _seen.add(mod)
                         yield (name, mod, name)
 
-        if include_uninstalled and not os.getenv("DISABLE_PREFIX_PLUGINS"):
-            from pkgutil import iter_modules
-
+        if include_uninstalled and not prefix_disabled:
             if not prefix:
                 raise ValueError(
                     "A prefix must be provided with 'include_uninstalled'."
                 )
-            for finder, mod_name, ispkg in iter_modules():
-                if (
-                    mod_name.startswith(prefix)
-                    and mod_name != prefix
-                    and mod_name not in _seen
-                ):
+            for mod_name in _get_prefixed_modules(prefix):
+                if mod_name != prefix and mod_name not in _seen:
                     yield (mod_name, mod_name, None)
@@ -8,7 +8,12 @@ from napari_plugin_engine import (
     PluginValidationError,
 )
 from napari_plugin_engine.dist import get_version, standard_metadata
-from napari_plugin_engine.manager import temp_path_additions
+from napari_plugin_engine.manager import (
+    _HookRelay,
+    clear_plugin_cache,
+    iter_available_plugins,
+    temp_path_additions,
+)
 
 GOOD_PLUGIN = """
 from napari_plugin_engine import HookImplementationMarker
@@ -375,6 +380,85 @@ def test_identical_entry_point_discovery(
     assert len(test_plugin_manager.plugins) == 2
 
 
+def test_dist_cache(tmp_path, good_entrypoint_plugin):
+    def available():
+        return list(iter_available_plugins('app.plugin', path=tmp_path))
+
+    assert available() == [
+        ('good_entry', 'good_entrypoint_plugin', 'good_entry')
+    ]
+
+    # metadata is cached until explicitly cleared
+    distinfo = tmp_path / "good_entrypoint_plugin-1.2.3.dist-info"
+    (distinfo / "entry_points.txt").write_text("[app.plugin]\n")
+    assert len(available()) == 1
+    clear_plugin_cache()
+    assert not available()
+
+
+def test_clear_plugin_cache_get_dist(tmp_path, good_entrypoint_plugin):
+    import shutil
+    import types
+
+    from napari_plugin_engine.dist import get_dist
+
+    module = types.ModuleType('good_entrypoint_plugin')
+    with temp_path_additions(tmp_path):
+        clear_plugin_cache()
+        assert get_dist(module).metadata['name'] == 'good_entry'
+
+        # the module -> distribution mapping is cleared as well
+        shutil.rmtree(tmp_path / "good_entrypoint_plugin-1.2.3.dist-info")
+        assert get_dist(module) is not None
+        clear_plugin_cache()
+        assert get_dist(module) is None
+
+
+def test_repeated_discover_path(tmp_path, good_entrypoint_plugin):
+    from napari_plugin_engine import PluginManager
+    from napari_plugin_engine.dist import _DISTRIBUTIONS
+
+    pm = PluginManager('test', discover_entry_point='app.plugin')
+    for _ in range(4):
+        pm.discover(path=str(tmp_path))
+    assert 'good_entry' in pm.plugins
+    # sys.path differs on every call, only the latest distributions are kept
+    assert len(_DISTRIBUTIONS) == 1
+
+
+def test_duplicate_path_entries(tmp_path, good_entrypoint_plugin):
+    available = iter_available_plugins('app.plugin', path=[tmp_path] * 2)
+    assert list(available) == [
+        ('good_entry', 'good_entrypoint_plugin', 'good_entry')
+    ]
+
+
+def test_prefix_module_cache(tmp_path):
+    def available():
+        return list(iter_available_plugins(prefix='app_', path=tmp_path))
+
+    (tmp_path / "app_one.py").write_text("")
+    assert ('app_one', 'app_one', None) in available()
+
+    # module listings are cached until explicitly cleared
+    (tmp_path / "app_two.py").write_text("")
+    assert ('app_two', 'app_two', None) not in available()
+    clear_plugin_cache()
+    assert ('app_two', 'app_two', None) in available()
+
+
+def test_repeated_discover_prefix_path(tmp_path, app_good_plugin):
+    from napari_plugin_engine import PluginManager
+    from napari_plugin_engine.manager import _PREFIX_MODULE_CACHE
+
+    pm = PluginManager('test', discover_prefix='app_')
+    for _ in range(4):
+        pm.discover(path=str(tmp_path))
+    assert 'app_good_plugin' in pm.plugins
+    # sys.path differs on every call, only the latest listings are kept
+    assert len({sys_path for sys_path, _ in _PREFIX_MODULE_CACHE}) == 1
+
+
 def test_lazy_autodiscovery(
     tmp_path, add_specification, test_plugin_manager, good_entrypoint_plugin
 ):
@@ -395,6 +479,13 @@ def test_lazy_autodiscovery(
     assert hook_caller.spec
     assert test_plugin_manager.plugins.get('good_entry')
     assert test_plugin_manager.hook._needs_discovery is False
+    # once discovered, hook access no longer goes through the discovery check
+    assert type(test_plugin_manager.hook) is _HookRelay
+    assert _HookRelay.__getattribute__ is object.__getattribute__
+
+    with test_plugin_manager.discovery_blocked():
+        assert test_plugin_manager.hook._needs_discovery is False
+    assert test_plugin_manager.hook._needs_discovery is False
 
 
 def test_discovery_all_together(full_plugin_manager):
@@ -419,12 +510,29 @@ def test_getting_errors(invalid_entrypoint_plugin, caplog):
     assert mod in {p.plugin for p in errs}
     errs = PluginError.get(plugin_name='invalid')
     assert 'invalid' in {p.plugin_name for p in errs}
+    assert err in PluginError.get(plugin=mod, error_type=ValueError)
+    assert err not in PluginError.get(plugin=mod, error_type=KeyError)
+    with pytest.raises(TypeError):
+        PluginError.get(plugin=object(), error_type='ValueError')
 
     assert 'I caused this' in err.format()
     err.log()
     assert ' Error in plugin "invalid"' in caplog.text
 
 
+def test_error_record_limits(monkeypatch):
+    monkeypatch.setattr(PluginError, '_record', [])
+    monkeypatch.setattr(PluginError, 'max_records', 2)
+    errs = [PluginError(plugin_name='plugin') for _ in range(3)]
+    assert PluginError.get(plugin_name='plugin') == errs[1:]
+    PluginError(plugin_name='other')
+    assert PluginError.get(plugin_name='plugin') == errs[2:]
+
+    monkeypatch.setattr(PluginError, 'record_enabled', False)
+    PluginError(plugin_name='plugin')
+    assert PluginError.get(plugin_name='plugin') == errs[2:]
+
+
 @pytest.mark.parametrize('blocked', ['ALL', 'ENTRYPOINT', 'PREFIX'])
 def test_env_var_disable(
     blocked,
@@ -2,7 +2,7 @@ import sys
 
 import pytest
 
-from napari_plugin_engine.implementation import varnames
+from napari_plugin_engine.implementation import _varnames_cache, varnames
 from napari_plugin_engine.manager import (
     _formatdef,
     ensure_namespace,
@@ -54,6 +54,10 @@ def test_varnames_class():
     assert varnames(E) == (("x",), ())
     assert varnames(F) == ((), ())
 
+    # classes cannot store the result in their __dict__
+    assert _varnames_cache[C] == (("x",), ())
+    assert varnames(C) == (("x",), ())
+
 
 @pytest.mark.skipif(
     sys.version_info < (3,), reason="Keyword only arguments are Python 3 only"
@@ -123,3 +127,59 @@ def test_temp_path():
         assert '/path/' in sys.path
 
     assert set(sys.path) == orig_path
+
+
+def test_lazy_dir():
+    import napari_plugin_engine
+
+    names = dir(napari_plugin_engine)
+    assert set(napari_plugin_engine.__all__).issubset(names)
+    assert "__version__" in names
+
+
+def test_lazy_submodules():
+    import subprocess
+
+    import napari_plugin_engine
+
+    # run in a fresh interpreter, where no submodule has been imported yet
+    code = (
+        "import napari_plugin_engine as pkg; "
+        "print(pkg.manager.__name__, pkg.dist.__name__)"
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    assert output.split() == [
+        'napari_plugin_engine.manager',
+        'napari_plugin_engine.dist',
+    ]
+    names = dir(napari_plugin_engine)
+    assert 'exceptions' in names
+    assert not {'sys', 'import_module', 'Any', 'TYPE_CHECKING'} & set(names)
+
+
+def test_lazy_public_names():
+    import napari_plugin_engine
+    from napari_plugin_engine import markers
+
+    for name in napari_plugin_engine.__all__:
+        assert getattr(napari_plugin_engine, name) is not None
+    marker = napari_plugin_engine.napari_hook_implementation
+    assert isinstance(marker, markers.HookImplementationMarker)
+    assert marker is napari_plugin_engine.napari_hook_implementation
+    assert marker.project_name == "napari"
+    with pytest.raises(AttributeError):
+        napari_plugin_engine.not_a_name
+
+
+def test_importlib_metadata_attribute(monkeypatch):
+    from types import SimpleNamespace
+
+    from napari_plugin_engine import dist, manager
+
+    assert callable(dist.importlib_metadata.distributions)
+    assert manager.importlib_metadata is dist.importlib_metadata
+
+    # replacing the module attribute affects lookups, as it used to
+    fake = SimpleNamespace(distribution=lambda name: name)
+    monkeypatch.setattr(dist, 'importlib_metadata', fake)
+    assert dist.get_dist('some-package') == 'some-package'
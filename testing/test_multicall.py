@@ -101,6 +101,13 @@ def test_call_none_is_no_result():
     assert multicall([func1, func2], {}, {}) == [1]
 
 
+def test_multicall_no_impls():
+    assert multicall([], {}) == []
+    assert multicall([], {}, firstresult=True) is None
+    # results are not shared between calls
+    assert _multicall([], {}).result is not _multicall([], {}).result
+
+
 def test_hookwrapper():
     out = []
 
@@ -179,3 +186,19 @@ def test_hookwrapper_exception(exc):
     with pytest.raises(exc):
         multicall([func2, func1], {})
     assert out == ["func1 init", "func1 finish"]
+
+
+def test_hookwrapper_force_result():
+    @example_implementation(hookwrapper=True)
+    def func1():
+        outcome = yield None
+        outcome.force_result([3])
+
+    @example_implementation
+    def func2():
+        return 2
+
+    impls = [HookImplementation(f, **f.example_impl) for f in (func2, func1)]
+    outcome = _multicall(impls, {})
+    assert outcome.result == [3]
+    assert outcome._modified_by == "func1"
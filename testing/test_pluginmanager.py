@@ -63,6 +63,82 @@ def test_register_dynamic_attr(he_pm):
     assert not he_pm.get_hookcallers(a)
 
 
+def test_register_module_getattr(he_pm):
+    """Hooks provided by a module level __getattr__ (PEP 562) are found."""
+    import types
+
+    @hookimpl
+    def he_method1(arg):
+        return 'lazy'
+
+    def __getattr__(name):
+        if name == 'he_method1':
+            return he_method1
+        raise AttributeError(name)
+
+    module = types.ModuleType('lazy_plugin')
+    module.__getattr__ = __getattr__
+    module.__dir__ = lambda: ['he_method1']
+    he_pm.register(module)
+    assert he_pm.hook.he_method1(arg=1) == ['lazy']
+
+
+def test_register_instance_dir(he_pm):
+    """Hooks listed by __dir__ and provided by __getattr__ are found."""
+
+    @hookimpl
+    def he_method1(arg):
+        return 'dynamic'
+
+    class Plugin:
+        def __getattr__(self, name):
+            if name == 'he_method1':
+                return he_method1
+            raise AttributeError(name)
+
+        def __dir__(self):
+            return [*super().__dir__(), 'he_method1']
+
+    he_pm.register(Plugin())
+    assert he_pm.hook.he_method1(arg=1) == ['dynamic']
+
+
+def test_register_skips_properties(pm):
+    class Hooks:
+        @hookspec
+        def he_method1(self, arg):
+            pass
+
+    class Base:
+        @hookimpl
+        def he_method1(self, arg):
+            return arg + 1
+
+    class Plugin(Base):
+        @property
+        def broken(self):
+            raise RuntimeError("properties should not be evaluated")
+
+    pm.add_hookspecs(Hooks)
+    pm.register(Plugin())
+    assert pm.hook.he_method1(arg=1) == [2]
+
+
+def test_register_slots(he_pm):
+    @hookimpl
+    def he_method1(arg):
+        return arg + 1
+
+    class Plugin:
+        __slots__ = ('hook', 'unset')
+
+        def __init__(self):
+            self.hook = he_method1
+
+    he_pm.register(Plugin())
+    assert he_pm.hook.he_method1(arg=1) == [2]
+
+
 def test_pm_name(pm):
     class A:
         pass
@@ -114,6 +190,29 @@ def test_register_mismatch_method(he_pm):
     assert excinfo.value.plugin is plugin
 
 
+def test_check_pending_unverified_hook(he_pm):
+    class hello:
+        @hookimpl
+        def he_method_later(self):
+            pass
+
+    he_pm.register(hello())
+    # accessing the hook creates a HookCaller without a specification
+    assert not he_pm.hook.he_method_later.has_spec()
+    assert he_pm.hook._unverified == {"he_method_later"}
+    with pytest.raises(PluginValidationError):
+        he_pm.check_pending()
+
+    class Hooks:
+        @hookspec
+        def he_method_later(self):
+            pass
+
+    he_pm.add_hookspecs(Hooks)
+    assert not he_pm.hook._unverified
+    he_pm.check_pending()
+
+
 def test_register_mismatch_arg(he_pm):
     class hello:
         @hookimpl
@@ -206,6 +305,54 @@ def test_register_unknown_hooks(pm):
     assert len(pm.get_hookcallers(pm.plugins.get(pname))) == 1
 
 
+def test_unknown_hook_caller_created_lazily(pm):
+    class Plugin1:
+        @hookimpl
+        def he_method1(self, arg):
+            return arg + 1
+
+    plugin = Plugin1()
+    pm.register(plugin)
+    assert 'he_method1' not in pm.hook.__dict__
+    assert 'he_method1' in pm.hook._pending
+
+    # first access creates the HookCaller
+    assert pm.hook.he_method1(arg=1) == [2]
+    assert 'he_method1' in pm.hook.__dict__
+    assert not pm.hook._pending
+    assert pm.get_hookcallers(plugin) == [pm.hook.he_method1]
+
+
+def test_failed_register_leaves_no_pending_hookimpls(he_pm):
+    class Bad:
+        @hookimpl
+        def a_unknown(self):
+            pass
+
+        @hookimpl
+        def he_method1(self, arg, not_in_spec):
+            pass
+
+    with pytest.raises(PluginValidationError):
+        he_pm.register(Bad)
+    assert not he_pm.hook._pending
+    assert len(he_pm.hooks) == 1
+    assert he_pm.hooks.items() == [('he_method1', he_pm.hook.he_method1)]
+    he_pm.check_pending()
+
+
+def test_unregister_pending_hookimpl(pm):
+    class Plugin1:
+        @hookimpl(optionalhook=True)
+        def he_method1(self, arg):
+            return arg + 1
+
+    pm.register(Plugin1, name='p1')
+    pm.unregister('p1')
+    assert not pm.hook._pending
+    assert not hasattr(pm.hook, 'he_method1')
+
+
 def test_register_historic(pm):
     class Hooks:
         @hookspec(historic=True)
@@ -458,6 +605,97 @@ def test_get_hookimpls(pm):
     assert hook_plugins == [plugin1, plugin2]
 
 
+def test_plugin_info_cache(he_pm):
+    class Plugin1:
+        @hookimpl
+        def he_method1(self, arg):
+            pass
+
+    he_pm.register(Plugin1, name='plugin1')
+    info = he_pm.plugin_info('plugin1')
+    assert 'he_method1' in info
+    assert he_pm.plugin_info('plugin1') is info
+    assert 'plugin1' in str(he_pm)
+
+    he_pm.unregister('plugin1')
+    assert 'plugin1' not in he_pm._plugin_info_cache
+    assert 'plugin1' not in str(he_pm)
+
+
+def test_list_plugin_metadata_copies(he_pm):
+    class Plugin1:
+        @hookimpl
+        def he_method1(self, arg):
+            pass
+
+    he_pm.register(Plugin1, name='plugin1')
+    metadata = he_pm.list_plugin_metadata()
+    assert metadata[0]['hooks'] == ['he_method1']
+    metadata[0]['hooks'].append('bogus')
+    metadata[0]['plugin_name'] = 'bogus'
+    metadata = he_pm.list_plugin_metadata()
+    assert metadata[0]['hooks'] == ['he_method1']
+    assert metadata[0]['plugin_name'] == 'plugin1'
+
+
+def test_prune_clears_plugin_info(he_pm, tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    (tmp_path / 'pruned_plugin.py').write_text(
+        'from napari_plugin_engine import HookImplementationMarker\n'
+        '@HookImplementationMarker("example")\n'
+        'def he_method1(arg):\n'
+        '    pass\n'
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module('pruned_plugin')
+    try:
+        he_pm.register(module)
+        info = he_pm.plugin_info(module)
+        version = he_pm._registration_version
+        # a pruned plugin may have been reinstalled with another version
+        he_pm.prune()
+        assert he_pm._registration_version != version
+        assert he_pm.plugin_info(module) is not info
+    finally:
+        del sys.modules['pruned_plugin']
+
+
+def test_str_plugin_order(he_pm):
+    he_pm.register(type('B', (), {}), name='b_plugin')
+    he_pm.register(type('A', (), {}), name='a_plugin')
+    text = str(he_pm)
+    assert text.index('a_plugin') < text.index('b_plugin')
+
+    he_pm.unregister('a_plugin')
+    he_pm.register(type('C', (), {}), name='c_plugin')
+    text = str(he_pm)
+    assert 'a_plugin' not in text
+    assert text.index('b_plugin') < text.index('c_plugin')
+
+
+def test_hook_relay_items(he_pm):
+    assert len(he_pm.hook) == 1
+    assert he_pm.hook.items() == [('he_method1', he_pm.hook.he_method1)]
+    assert he_pm.hook.values() == [he_pm.hook.he_method1]
+
+    del he_pm.hook.he_method1
+    assert len(he_pm.hook) == 0
+    assert not he_pm.hook.items()
+
+
+def test_hook_relay_other_attributes(he_pm):
+    he_pm.hook.something = 1
+    assert he_pm.hook.something == 1
+    assert he_pm.hook.items() == [('he_method1', he_pm.hook.he_method1)]
+
+    # replacing a hook caller removes it from the relay's hooks
+    he_pm.hook.he_method1 = None
+    assert not he_pm.hook.items()
+    he_pm.check_pending()
+
+
 def test_add_hookspecs_nohooks(pm):
     with pytest.raises(ValueError):
         pm.add_hookspecs(10)